@@ -25,6 +25,11 @@ WHITE_BOLD = "\033[1m"
 
 MAX_TIMEOUT = 60 * 5
 
+# Engine processes are started with close_fds=False and without preexec_fn,
+# start_new_session, cwd or pass_fds so that subprocess can use the faster
+# posix_spawn() path instead of fork()+exec(). The pipes subprocess creates
+# are non-inheritable, so no descriptors leak into the engine.
+
 PATH = pathlib.Path(__file__).parent.resolve()
 
 
@@ -308,6 +313,7 @@ class Stockfish:
                 self.prefix + [self.path] + self.args,
                 capture_output=True,
                 text=True,
+                close_fds=False,
             )
 
             if self.process.returncode != 0:
@@ -324,6 +330,7 @@ class Stockfish:
             stderr=subprocess.STDOUT,
             universal_newlines=True,
             bufsize=1,
+            close_fds=False,
         )
 
     def setoption(self, name: str, value: str):